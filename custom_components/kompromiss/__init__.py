@@ -1,61 +1,77 @@
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry, UpdateListenerType
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 
 from .const import (
     INDOOR_TEMPERATURE_SENSOR,
     PLATFORMS,
-    DOMAIN,
     ACTUAL_OUTDOOR_TEMPERATURE_SENSOR,
 )
 from .controller import TemperatureController
+from .data import KompromissConfigEntry, KompromissRuntimeData
 
 
-async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
-    hass.data.setdefault(DOMAIN, {})
-
-    actual_temp_entity_id = config_entry.data.get(ACTUAL_OUTDOOR_TEMPERATURE_SENSOR)
-    indoor_temperature_entity_id = config_entry.data.get(INDOOR_TEMPERATURE_SENSOR)
-
+async def async_setup_entry(
+    hass: HomeAssistant, config_entry: KompromissConfigEntry
+) -> bool:
+    data = config_entry.data
     controller = TemperatureController(
         hass,
-        actual_temp_entity_id,
-        indoor_temperature_entity_id,
+        data.get(ACTUAL_OUTDOOR_TEMPERATURE_SENSOR),
+        data.get(INDOOR_TEMPERATURE_SENSOR),
     )
 
     await controller.async_subscribe()
+    config_entry.async_on_unload(controller.async_unsubscribe)
 
-    # Apply initial parameters from options if they exist
-    if config_entry.options:
-        await controller.update_parameters_from_options(config_entry.options)
+    try:
+        # Apply initial parameters from options if they exist
+        if config_entry.options:
+            await controller.update_parameters_from_options(config_entry.options)
 
-    hass.data[DOMAIN][config_entry.entry_id] = controller
+        # A reload racing the previous unload may have left a controller behind
+        previous = getattr(config_entry, "runtime_data", None)
+        if previous is not None:
+            previous.controller.async_unsubscribe()
 
-    # Register options update listener
-    config_entry.async_on_unload(
-        config_entry.add_update_listener(async_options_updated)
-    )
+        config_entry.runtime_data = KompromissRuntimeData(controller)
+
+        # Register options update listener
+        _register_update_listener(config_entry, async_options_updated)
+
+        await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    except Exception:
+        # Don't leave the state listeners behind if setup fails halfway
+        controller.async_unsubscribe()
+        raise
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
     return True
 
 
-async def async_options_updated(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+def _register_update_listener(
+    config_entry: ConfigEntry, listener: UpdateListenerType
+) -> CALLBACK_TYPE:
+    """Add an update listener that is removed when the entry unloads."""
+    unsub = config_entry.add_update_listener(listener)
+    config_entry.async_on_unload(unsub)
+    return unsub
+
+
+async def async_options_updated(
+    _hass: HomeAssistant, config_entry: KompromissConfigEntry
+) -> None:
     """Handle options update.
 
     This is called when the user saves changes in the options flow.
     We update the controller parameters without reloading the integration.
     """
-    controller = hass.data[DOMAIN].get(config_entry.entry_id)
-    if controller:
-        await controller.update_parameters_from_options(config_entry.options)
+    await config_entry.runtime_data.controller.update_parameters_from_options(
+        config_entry.options
+    )
 
 
-async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
-    unload_ok = await hass.config_entries.async_unload_platforms(
-        config_entry, PLATFORMS
-    )
-    if unload_ok:
-        controller = hass.data[DOMAIN].pop(config_entry.entry_id, None)
-        if controller:
-            controller.async_unsubscribe()
-    return unload_ok
+async def async_unload_entry(
+    hass: HomeAssistant, config_entry: KompromissConfigEntry
+) -> bool:
+    # The controller unsubscribes itself through async_on_unload and the
+    # runtime data is dropped together with the entry
+    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
 from typing import Any, Final
 import logging
 
@@ -64,6 +67,188 @@ from .const import (
 _LOGGER: Final = logging.getLogger(__name__)
 
 
+@cache
+def _number_selector(
+    minimum: float, maximum: float, step: float
+) -> selector.NumberSelector:
+    """Return a shared box-mode number selector for the given range."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=minimum,
+            max=maximum,
+            step=step,
+            mode=selector.NumberSelectorMode.BOX,
+        )
+    )
+
+
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            ACTUAL_OUTDOOR_TEMPERATURE_SENSOR,
+        ): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain=["sensor"], device_class="temperature")
+        ),
+        vol.Required(
+            INDOOR_TEMPERATURE_SENSOR,
+        ): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain=["sensor"], device_class="temperature")
+        ),
+    }
+)
+
+# Fallback values for options that have not been set yet
+_DEFAULTS: Final[Mapping[str, Any]] = MappingProxyType(
+    {
+        PREDICTION_HORIZON: DEFAULT_PREDICTION_HORIZON,
+        TIME_STEP: DEFAULT_TIME_STEP,
+        TEMPERATURE_DEVIATION_PENALTY: DEFAULT_TEMPERATURE_DEVIATION_PENALTY,
+        COMFORT_BAND_VIOLATION_PENALTY: DEFAULT_COMFORT_BAND_VIOLATION_PENALTY,
+        ENERGY_COST_PENALTY: DEFAULT_ENERGY_COST_PENALTY,
+        SIMULATED_OUTDOOR_MOVE_PENALTY: DEFAULT_SIMULATED_OUTDOOR_MOVE_PENALTY,
+        HEATER_THERMAL_POWER: DEFAULT_HEATER_THERMAL_POWER,
+        HEAT_CURVE_SLOPE: DEFAULT_HEAT_CURVE_SLOPE,
+        HEAT_CURVE_INTERCEPT: DEFAULT_HEAT_CURVE_INTERCEPT,
+        HEATER_TRANSFER_COEFFICIENT: DEFAULT_HEATER_TRANSFER_COEFFICIENT,
+        LOWEST_SIMULATED_TEMPERATURE: DEFAULT_LOWEST_SIMULATED_TEMPERATURE,
+        HIGHEST_SIMULATED_TEMPERATURE: DEFAULT_HIGHEST_SIMULATED_TEMPERATURE,
+        ELECTRICITY_PRICE_ENABLED: DEFAULT_ELECTRICITY_PRICE_ENABLED,
+        ELECTRICITY_PRICE_AREA: DEFAULT_ELECTRICITY_PRICE_AREA,
+        ELECTRICITY_PRICE_CURRENCY: DEFAULT_ELECTRICITY_PRICE_CURRENCY,
+        THERMAL_RESISTANCE: DEFAULT_THERMAL_RESISTANCE,
+        THERMAL_CAPACITANCE: DEFAULT_THERMAL_CAPACITANCE,
+        MEDIUM_TO_BUILDING_THERMAL_RESISTANCE: DEFAULT_MEDIUM_TO_BUILDING_THERMAL_RESISTANCE,
+        MEDIUM_TO_OUTDOOR_THERMAL_RESISTANCE: DEFAULT_MEDIUM_TO_OUTDOOR_THERMAL_RESISTANCE,
+        MEDIUM_THERMAL_CAPACITY: DEFAULT_MEDIUM_THERMAL_CAPACITY,
+    }
+)
+
+
+# Options schemas are built once, current values are suggested per render
+_MPC_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            PREDICTION_HORIZON, default=_DEFAULTS[PREDICTION_HORIZON]
+        ): _number_selector(1, 1000, 1),
+        vol.Optional(TIME_STEP, default=_DEFAULTS[TIME_STEP]): _number_selector(
+            1, 7200, 10
+        ),
+        vol.Optional(
+            TEMPERATURE_DEVIATION_PENALTY,
+            default=_DEFAULTS[TEMPERATURE_DEVIATION_PENALTY],
+        ): _number_selector(0.0, 1000000.0, 100.0),
+        vol.Optional(
+            COMFORT_BAND_VIOLATION_PENALTY,
+            default=_DEFAULTS[COMFORT_BAND_VIOLATION_PENALTY],
+        ): _number_selector(0.0, 1000000.0, 100.0),
+        vol.Optional(
+            ENERGY_COST_PENALTY, default=_DEFAULTS[ENERGY_COST_PENALTY]
+        ): _number_selector(0.0, 1000.0, 1.0),
+        vol.Optional(
+            SIMULATED_OUTDOOR_MOVE_PENALTY,
+            default=_DEFAULTS[SIMULATED_OUTDOOR_MOVE_PENALTY],
+        ): _number_selector(0.0, 1000.0, 5.0),
+    }
+)
+
+_HEATER_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            HEATER_THERMAL_POWER, default=_DEFAULTS[HEATER_THERMAL_POWER]
+        ): _number_selector(0.0, 100000.0, 100.0),
+        vol.Optional(
+            HEAT_CURVE_SLOPE, default=_DEFAULTS[HEAT_CURVE_SLOPE]
+        ): _number_selector(-1, -0.1, 0.05),
+        vol.Optional(
+            HEAT_CURVE_INTERCEPT, default=_DEFAULTS[HEAT_CURVE_INTERCEPT]
+        ): _number_selector(1, 100, 0.5),
+        vol.Optional(
+            HEATER_TRANSFER_COEFFICIENT, default=_DEFAULTS[HEATER_TRANSFER_COEFFICIENT]
+        ): _number_selector(100.0, 5000.0, 10.0),
+    }
+)
+
+_OUTPUT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            LOWEST_SIMULATED_TEMPERATURE,
+            default=_DEFAULTS[LOWEST_SIMULATED_TEMPERATURE],
+        ): _number_selector(-50, 10, 1),
+        vol.Optional(
+            HIGHEST_SIMULATED_TEMPERATURE,
+            default=_DEFAULTS[HIGHEST_SIMULATED_TEMPERATURE],
+        ): _number_selector(10, 50, 1),
+        vol.Optional(
+            SIMULATED_OUTDOOR_MOVE_PENALTY,
+            default=_DEFAULTS[SIMULATED_OUTDOOR_MOVE_PENALTY],
+        ): _number_selector(10, 200, 1),
+    }
+)
+
+_PRICING_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            ELECTRICITY_PRICE_ENABLED, default=_DEFAULTS[ELECTRICITY_PRICE_ENABLED]
+        ): selector.BooleanSelector(),
+        vol.Optional(
+            ELECTRICITY_PRICE_AREA, default=_DEFAULTS[ELECTRICITY_PRICE_AREA]
+        ): selector.TextSelector(),
+        vol.Optional(
+            ELECTRICITY_PRICE_CURRENCY, default=_DEFAULTS[ELECTRICITY_PRICE_CURRENCY]
+        ): selector.TextSelector(),
+    }
+)
+
+_THERMAL_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            THERMAL_RESISTANCE, default=_DEFAULTS[THERMAL_RESISTANCE]
+        ): _number_selector(0.001, 0.1, 0.001),
+        vol.Optional(
+            THERMAL_CAPACITANCE, default=_DEFAULTS[THERMAL_CAPACITANCE]
+        ): _number_selector(1e6, 5e7, 1e5),
+        vol.Optional(
+            MEDIUM_TO_BUILDING_THERMAL_RESISTANCE,
+            default=_DEFAULTS[MEDIUM_TO_BUILDING_THERMAL_RESISTANCE],
+        ): _number_selector(0.001, 0.1, 0.001),
+        vol.Optional(
+            MEDIUM_TO_OUTDOOR_THERMAL_RESISTANCE,
+            default=_DEFAULTS[MEDIUM_TO_OUTDOOR_THERMAL_RESISTANCE],
+        ): _number_selector(0.001, 10.0, 0.001),
+        vol.Optional(
+            MEDIUM_THERMAL_CAPACITY, default=_DEFAULTS[MEDIUM_THERMAL_CAPACITY]
+        ): _number_selector(1e5, 5e7, 1e5),
+    }
+)
+
+
+# Form descriptions are static, so share one dict per step
+_MPC_PLACEHOLDERS: Final[dict[str, str]] = {"description": "MPC control parameters."}
+_HEATER_PLACEHOLDERS: Final[dict[str, str]] = {"description": "Heater parameters."}
+_OUTPUT_PLACEHOLDERS: Final[dict[str, str]] = {
+    "description": "Simulated Outdoor Temperature Options."
+}
+_PRICING_PLACEHOLDERS: Final[dict[str, str]] = {
+    "description": "Electricity pricing options."
+}
+_THERMAL_PLACEHOLDERS: Final[dict[str, str]] = {
+    "description": "Thermal model parameters."
+}
+
+# Schema and description for each options menu step
+_OPTIONS_STEPS: Final[Mapping[str, tuple[vol.Schema, dict[str, str]]]] = (
+    MappingProxyType(
+        {
+            "mpc": (_MPC_SCHEMA, _MPC_PLACEHOLDERS),
+            "heater": (_HEATER_SCHEMA, _HEATER_PLACEHOLDERS),
+            "output": (_OUTPUT_SCHEMA, _OUTPUT_PLACEHOLDERS),
+            "pricing": (_PRICING_SCHEMA, _PRICING_PLACEHOLDERS),
+            "thermal": (_THERMAL_SCHEMA, _THERMAL_PLACEHOLDERS),
+        }
+    )
+)
+
+
 class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Kompromiss."""
 
@@ -73,26 +258,7 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             return self.async_create_entry(title="Kompromiss", data=user_input)
 
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    ACTUAL_OUTDOOR_TEMPERATURE_SENSOR,
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["sensor"], device_class="temperature"
-                    )
-                ),
-                vol.Required(
-                    INDOOR_TEMPERATURE_SENSOR,
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["sensor"], device_class="temperature"
-                    )
-                ),
-            }
-        )
-
-        return self.async_show_form(step_id="user", data_schema=schema)
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA)
 
     @staticmethod
     @callback
@@ -117,369 +283,41 @@ class KompromissOptionsFlowHandler(OptionsFlow):
         """Manage the options - main menu."""
         return self.async_show_menu(
             step_id="init",
-            menu_options=["mpc", "heater", "output", "pricing", "thermal"],
+            menu_options=list(_OPTIONS_STEPS),
         )
 
-    async def async_step_mpc(self, user_input: dict[str, Any] | None = None):
-        """Handle MPC tuning parameters."""
+    async def _async_step(
+        self, step_id: str, user_input: dict[str, Any] | None
+    ) -> ConfigFlowResult:
+        """Save submitted options or show the form for an options step."""
         if user_input is not None:
             return self.async_create_entry(data=user_input)
 
-        schema = vol.Schema(
-            {
-                vol.Optional(
-                    PREDICTION_HORIZON,
-                    default=self.config_entry.options.get(
-                        PREDICTION_HORIZON,
-                        DEFAULT_PREDICTION_HORIZON,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1,
-                        max=1000,
-                        step=1,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    TIME_STEP,
-                    default=self.config_entry.options.get(
-                        TIME_STEP,
-                        DEFAULT_TIME_STEP,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1,
-                        max=7200,
-                        step=10,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    TEMPERATURE_DEVIATION_PENALTY,
-                    default=self.config_entry.options.get(
-                        TEMPERATURE_DEVIATION_PENALTY,
-                        DEFAULT_TEMPERATURE_DEVIATION_PENALTY,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0.0,
-                        max=1000000.0,
-                        step=100.0,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    COMFORT_BAND_VIOLATION_PENALTY,
-                    default=self.config_entry.options.get(
-                        COMFORT_BAND_VIOLATION_PENALTY,
-                        DEFAULT_COMFORT_BAND_VIOLATION_PENALTY,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0.0,
-                        max=1000000.0,
-                        step=100.0,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    ENERGY_COST_PENALTY,
-                    default=self.config_entry.options.get(
-                        ENERGY_COST_PENALTY, DEFAULT_ENERGY_COST_PENALTY
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0.0,
-                        max=1000.0,
-                        step=1.0,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    SIMULATED_OUTDOOR_MOVE_PENALTY,
-                    default=self.config_entry.options.get(
-                        SIMULATED_OUTDOOR_MOVE_PENALTY,
-                        DEFAULT_SIMULATED_OUTDOOR_MOVE_PENALTY,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0.0,
-                        max=1000.0,
-                        step=5.0,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-            }
-        )
-
+        schema, placeholders = _OPTIONS_STEPS[step_id]
         return self.async_show_form(
-            step_id="mpc",
+            step_id=step_id,
             data_schema=self.add_suggested_values_to_schema(
                 schema, self.config_entry.options
             ),
-            description_placeholders={"description": "MPC control parameters."},
+            description_placeholders=placeholders,
         )
 
+    async def async_step_mpc(self, user_input: dict[str, Any] | None = None):
+        """Handle MPC tuning parameters."""
+        return await self._async_step("mpc", user_input)
+
     async def async_step_heater(self, user_input: dict[str, Any] | None = None):
         """Handle heater parameters."""
-        if user_input is not None:
-            return self.async_create_entry(data=user_input)
-
-        schema = vol.Schema(
-            {
-                vol.Optional(
-                    HEATER_THERMAL_POWER,
-                    default=self.config_entry.options.get(
-                        HEATER_THERMAL_POWER,
-                        DEFAULT_HEATER_THERMAL_POWER,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0.0,
-                        max=100000.0,
-                        step=100.0,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    HEAT_CURVE_SLOPE,
-                    default=self.config_entry.options.get(
-                        HEAT_CURVE_SLOPE,
-                        DEFAULT_HEAT_CURVE_SLOPE,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-1,
-                        max=-0.1,
-                        step=0.05,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    HEAT_CURVE_INTERCEPT,
-                    default=self.config_entry.options.get(
-                        HEAT_CURVE_INTERCEPT,
-                        DEFAULT_HEAT_CURVE_INTERCEPT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1,
-                        max=100,
-                        step=0.5,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    HEATER_TRANSFER_COEFFICIENT,
-                    default=self.config_entry.options.get(
-                        HEATER_TRANSFER_COEFFICIENT,
-                        DEFAULT_HEATER_TRANSFER_COEFFICIENT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=100.0,
-                        max=5000.0,
-                        step=10.0,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-            }
-        )
-
-        return self.async_show_form(
-            step_id="heater",
-            data_schema=self.add_suggested_values_to_schema(
-                schema, self.config_entry.options
-            ),
-            description_placeholders={"description": "Heater parameters."},
-        )
+        return await self._async_step("heater", user_input)
 
     async def async_step_output(self, user_input: dict[str, Any] | None = None):
         """Handle output parameters."""
-        if user_input is not None:
-            return self.async_create_entry(data=user_input)
-
-        schema = vol.Schema(
-            {
-                vol.Optional(
-                    LOWEST_SIMULATED_TEMPERATURE,
-                    default=self.config_entry.options.get(
-                        LOWEST_SIMULATED_TEMPERATURE,
-                        DEFAULT_LOWEST_SIMULATED_TEMPERATURE,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-50,
-                        max=10,
-                        step=1,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    HIGHEST_SIMULATED_TEMPERATURE,
-                    default=self.config_entry.options.get(
-                        HIGHEST_SIMULATED_TEMPERATURE,
-                        DEFAULT_HIGHEST_SIMULATED_TEMPERATURE,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=10,
-                        max=50,
-                        step=1,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    SIMULATED_OUTDOOR_MOVE_PENALTY,
-                    default=self.config_entry.options.get(
-                        SIMULATED_OUTDOOR_MOVE_PENALTY,
-                        DEFAULT_SIMULATED_OUTDOOR_MOVE_PENALTY,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=10,
-                        max=200,
-                        step=1,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-            }
-        )
-
-        return self.async_show_form(
-            step_id="output",
-            data_schema=self.add_suggested_values_to_schema(
-                schema, self.config_entry.options
-            ),
-            description_placeholders={
-                "description": "Simulated Outdoor Temperature Options."
-            },
-        )
+        return await self._async_step("output", user_input)
 
     async def async_step_pricing(self, user_input: dict[str, Any] | None = None):
         """Handle pricing parameters."""
-        if user_input is not None:
-            return self.async_create_entry(data=user_input)
-
-        schema = vol.Schema(
-            {
-                vol.Optional(
-                    ELECTRICITY_PRICE_ENABLED,
-                    default=self.config_entry.options.get(
-                        ELECTRICITY_PRICE_ENABLED,
-                        DEFAULT_ELECTRICITY_PRICE_ENABLED,
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    ELECTRICITY_PRICE_AREA,
-                    default=self.config_entry.options.get(
-                        ELECTRICITY_PRICE_AREA,
-                        DEFAULT_ELECTRICITY_PRICE_AREA,
-                    ),
-                ): selector.TextSelector(),
-                vol.Optional(
-                    ELECTRICITY_PRICE_CURRENCY,
-                    default=self.config_entry.options.get(
-                        ELECTRICITY_PRICE_CURRENCY,
-                        DEFAULT_ELECTRICITY_PRICE_CURRENCY,
-                    ),
-                ): selector.TextSelector(),
-            }
-        )
-
-        return self.async_show_form(
-            step_id="pricing",
-            data_schema=self.add_suggested_values_to_schema(
-                schema, self.config_entry.options
-            ),
-            description_placeholders={"description": "Electricity pricing options."},
-        )
+        return await self._async_step("pricing", user_input)
 
     async def async_step_thermal(self, user_input: dict[str, Any] | None = None):
         """Handle thermal model parameters."""
-        if user_input is not None:
-            return self.async_create_entry(data=user_input)
-
-        schema = vol.Schema(
-            {
-                vol.Optional(
-                    THERMAL_RESISTANCE,
-                    default=self.config_entry.options.get(
-                        THERMAL_RESISTANCE,
-                        DEFAULT_THERMAL_RESISTANCE,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0.001,
-                        max=0.1,
-                        step=0.001,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    THERMAL_CAPACITANCE,
-                    default=self.config_entry.options.get(
-                        THERMAL_CAPACITANCE,
-                        DEFAULT_THERMAL_CAPACITANCE,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1e6,
-                        max=5e7,
-                        step=1e5,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    MEDIUM_TO_BUILDING_THERMAL_RESISTANCE,
-                    default=self.config_entry.options.get(
-                        MEDIUM_TO_BUILDING_THERMAL_RESISTANCE,
-                        DEFAULT_MEDIUM_TO_BUILDING_THERMAL_RESISTANCE,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0.001,
-                        max=0.1,
-                        step=0.001,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    MEDIUM_TO_OUTDOOR_THERMAL_RESISTANCE,
-                    default=self.config_entry.options.get(
-                        MEDIUM_TO_OUTDOOR_THERMAL_RESISTANCE,
-                        DEFAULT_MEDIUM_TO_OUTDOOR_THERMAL_RESISTANCE,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0.001,
-                        max=10.0,
-                        step=0.001,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Optional(
-                    MEDIUM_THERMAL_CAPACITY,
-                    default=self.config_entry.options.get(
-                        MEDIUM_THERMAL_CAPACITY,
-                        DEFAULT_MEDIUM_THERMAL_CAPACITY,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1e5,
-                        max=5e7,
-                        step=1e5,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-            }
-        )
-
-        return self.async_show_form(
-            step_id="thermal",
-            data_schema=self.add_suggested_values_to_schema(
-                schema, self.config_entry.options
-            ),
-            description_placeholders={"description": "Thermal model parameters."},
-        )
+        return await self._async_step("thermal", user_input)
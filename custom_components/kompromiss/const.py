@@ -1,7 +1,7 @@
 from homeassistant.const import Platform
 
 DOMAIN = "kompromiss"
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.NUMBER]
+PLATFORMS: tuple[Platform, ...] = (Platform.SENSOR, Platform.NUMBER)
 
 ACTUAL_OUTDOOR_TEMPERATURE_SENSOR = "actual_outdoor_temperature_sensor"
 SIMULATED_OUTDOOR_TEMPERATURE_SENSOR = "simulated_outdoor_temperature_sensor"
@@ -37,6 +37,9 @@ ELECTRICITY_PRICE_MINIMUM_HOURS_AVAILABLE = 8
 ELECTRICITY_PRICE_UPDATE_INTERVAL = 60 * 60  # 1 hour in seconds
 ELECTRICITY_PRICE_TIME_STEP = 900  # 15 minutes in seconds
 
+# Sensor updates arriving within this window share one MPC solve
+REGULATION_COOLDOWN = 0.2  # seconds
+
 MEDIUM_TO_BUILDING_THERMAL_RESISTANCE = "medium_to_building_thermal_resistance"
 DEFAULT_MEDIUM_TO_BUILDING_THERMAL_RESISTANCE = 0.0035
 MEDIUM_TO_OUTDOOR_THERMAL_RESISTANCE = "medium_to_outdoor_thermal_resistance"
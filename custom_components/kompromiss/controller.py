@@ -1,10 +1,20 @@
 """Controller for computing simulated outdoor temperature."""
 
+import asyncio
+import inspect
+import math
 import time
 from typing import Callable, Any, Final
 import logging
 
-from homeassistant.core import HomeAssistant, Event, EventStateChangedData
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    Event,
+    EventStateChangedData,
+)
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import (
@@ -12,11 +22,13 @@ from .const import (
     ELECTRICITY_PRICE_CURRENCY,
     ELECTRICITY_PRICE_ENABLED,
     ELECTRICITY_PRICE_UPDATE_INTERVAL,
+    REGULATION_COOLDOWN,
 )
 
 from .electricity import (
-    ElectricityPriceData,
+    ElectricityPriceSeries,
     fetch_next_24h_prices_15m,
+    find_nordpool_entry_id,
 )
 
 from .state import ControllerState
@@ -27,6 +39,18 @@ from .regulator.mpc import MPCRegulator
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+# Sensor states that carry no reading
+_INVALID_STATES: Final[frozenset[str]] = frozenset(
+    (STATE_UNKNOWN, STATE_UNAVAILABLE, "none", "")
+)
+
+
+def _is_unchanged(previous: float | None, value: float | None) -> bool:
+    """Return True if a new sensor reading equals the stored one."""
+    if previous is None or value is None:
+        return previous is value
+    return math.isclose(previous, value, abs_tol=1e-6)
+
 
 class TemperatureController:
     """Coordinates data flow between sensors and regulator."""
@@ -40,33 +64,62 @@ class TemperatureController:
         self._hass = hass
         self._actual_outdoor_temperature_entity_id = actual_temperature_entity_id
         self._indoor_temperature_entity_id = indoor_temperature_entity_id
+        # Which ControllerState field each tracked entity feeds
+        self._state_attributes: dict[str, str] = {
+            actual_temperature_entity_id: "actual_outdoor_temperature",
+            indoor_temperature_entity_id: "indoor_temperature",
+        }
         self._regulator: MPCRegulator = MPCRegulator()
-        self._unsub = None
+        self._unsub: CALLBACK_TYPE | None = None
         self._unsub_dispatchers = []
-        self._subscribers: list[Callable[[float | None], Any]] = []
+        self._subscribers: dict[Callable[[float | None], Any], None] = {}
         self._state = ControllerState()
         self._price_control_enabled = False
         self._price_area: str | None = None
         self._price_currency: str | None = None
         self._price_last_updated_at: float | None = None
+        self._nordpool_entry_id: str | None = None
+        # Bursts of sensor and option updates are coalesced into a single
+        # regulation that runs on whatever state is current when the cooldown ends
+        self._regulate_debouncer: Debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=REGULATION_COOLDOWN,
+            immediate=False,
+            function=self._regulate,
+        )
 
     def async_subscribe_sensor(self, callback: Callable[[float | None], Any]) -> None:
         """Subscribe a sensor to state change notifications."""
         if callback not in self._subscribers:
-            self._subscribers.append(callback)
+            self._subscribers = {**self._subscribers, callback: None}
 
     def async_unsubscribe_sensor(self, callback: Callable[[float | None], Any]) -> None:
         """Unsubscribe a sensor from state change notifications."""
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
+        if callback not in self._subscribers:
+            return
+
+        # Replace rather than mutate so a notification in progress keeps
+        # iterating over a stable snapshot
+        subscribers = dict(self._subscribers)
+        del subscribers[callback]
+        self._subscribers = subscribers
 
     async def _notify_subscribers(self) -> None:
         """Notify all subscribers of state changes."""
-        for callback in self._subscribers:
-            callback(self._state)
+        results = [callback(self._state) for callback in self._subscribers]
+
+        # Plain callbacks are done by now, async ones are awaited together
+        awaitables = [result for result in results if inspect.isawaitable(result)]
+        if awaitables:
+            await asyncio.gather(*awaitables)
 
     async def async_subscribe(self) -> None:
         """Register a listener for state updates."""
+        if self._unsub is not None:
+            # Already subscribed, don't stack a second listener
+            return
+
         self._unsub = async_track_state_change_event(
             self._hass,
             [
@@ -77,10 +130,12 @@ class TemperatureController:
         )
 
     def async_unsubscribe(self) -> None:
-        if getattr(self, "_unsub", None):
+        if self._unsub is not None:
             self._unsub()
             self._unsub = None
 
+        self._regulate_debouncer.async_cancel()
+
         # Unsubscribe from all dispatcher signals
         for unsub in self._unsub_dispatchers:
             unsub()
@@ -93,18 +148,22 @@ class TemperatureController:
         value = None
 
         # Extract and store actual temperature
-        if new_state and new_state.state not in ("unknown", "unavailable"):
+        if new_state and new_state.state not in _INVALID_STATES:
             try:
                 value = float(new_state.state)
             except (ValueError, TypeError):
                 # TODO: This error state must be handled better in the future
                 pass
 
-        entity_id = event.data.get("entity_id")
-        if entity_id == self._actual_outdoor_temperature_entity_id:
-            self._state.actual_outdoor_temperature = value
-        elif entity_id == self._indoor_temperature_entity_id:
-            self._state.indoor_temperature = value
+        attribute = self._state_attributes.get(event.data.get("entity_id"))
+        if attribute is not None:
+            if _is_unchanged(getattr(self._state, attribute), value):
+                return
+            setattr(self._state, attribute, value)
+
+        if not self._state.is_valid():
+            # Nothing to regulate yet, so don't fetch prices or touch the regulator
+            return
 
         if self._price_control_enabled and not self._state.electricity_price:
             await self._update_price_data()
@@ -112,14 +171,15 @@ class TemperatureController:
         if self._price_control_enabled and not self._state.electricity_price:
             raise RuntimeError("No electricity price data available")
 
-        self._regulator.set_state(self._state)
-
-        await self._regulate()
+        await self._regulate_debouncer.async_call()
 
     async def _regulate(self) -> None:
         """Invoke the regulator to compute new simulated outdoor temperature."""
 
-        if self._state is None or not self._state.is_valid():
+        # Same test as ControllerState.is_valid, without the method call;
+        # _state is always set, so there is no need to check it for None
+        state = self._state
+        if state.actual_outdoor_temperature is None or state.indoor_temperature is None:
             _LOGGER.debug("Controller state is not valid, skipping regulation")
             return
 
@@ -130,10 +190,8 @@ class TemperatureController:
             >= ELECTRICITY_PRICE_UPDATE_INTERVAL
         ):
             await self._update_price_data()
-            self._regulator.set_state(self._state)
 
-        await self._regulator.async_regulate()
-        self._state = self._regulator.get_state()
+        self._state = await self._regulator.async_step(self._state)
 
         await self._notify_subscribers()
 
@@ -153,6 +211,7 @@ class TemperatureController:
                 self._hass,
                 area=self._price_area,
                 currency=self._price_currency,
+                config_entry_id=self._get_nordpool_entry_id(),
             )
 
             if not self._state.electricity_price:
@@ -165,7 +224,14 @@ class TemperatureController:
                 "Failed to fetch electricity price data: %s",
                 e,
             )
-            self._state.electricity_price = []
+            self._state.electricity_price = ElectricityPriceSeries()
+
+    def _get_nordpool_entry_id(self) -> str:
+        """Return the Nordpool entry id, looking it up again if it went away."""
+        entry_id = self._nordpool_entry_id
+        if entry_id is None or not self._hass.config_entries.async_get_entry(entry_id):
+            entry_id = self._nordpool_entry_id = find_nordpool_entry_id(self._hass)
+        return entry_id
 
     async def update_parameters_from_options(self, options: dict) -> None:
         """Update regulator parameters from config entry options."""
@@ -197,13 +263,15 @@ class TemperatureController:
                 )
             self._price_currency = price_currency
         else:
-            self._state.electricity_price = []
+            self._state.electricity_price = ElectricityPriceSeries()
             self._price_area = None
             self._price_currency = None
 
         if self._price_control_enabled and update_price_data:
             await self._update_price_data()
-            self._regulator.set_state(self._state)
 
         self._regulator.update_parameters_from_options(options)
-        await self._regulate()
+
+        # Slider drags and the options update listener both land here, so
+        # let them share one solve
+        await self._regulate_debouncer.async_call()
@@ -0,0 +1,19 @@
+"""Runtime data for a loaded Kompromiss config entry."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.config_entries import ConfigEntry
+
+from .controller import TemperatureController
+
+
+@dataclass(slots=True)
+class KompromissRuntimeData:
+    """Objects owned by a loaded config entry."""
+
+    controller: TemperatureController
+
+
+KompromissConfigEntry = ConfigEntry[KompromissRuntimeData]
@@ -1,24 +1,60 @@
 from __future__ import annotations
+import asyncio
 import logging
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 
-from datetime import timedelta
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from homeassistant.util import dt as dt_util
+import numpy as np
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
 
 _LOGGER: Final = logging.getLogger(__name__)
 
 
-class ElectricityPriceData:
-    """Class to fetch electricity price data from Nordpool."""
+@dataclass(slots=True, frozen=True, eq=False)
+class ElectricityPriceSeries:
+    """Electricity prices from Nordpool, one entry per interval in time order.
+
+    Stored column-wise so the regulator can use the prices as an array.
+    Start and end times are UTC ISO 8601 strings, an end time is None when
+    Nordpool sent none or it couldn't be parsed.
+    """
+
+    start_times: tuple[str, ...] = ()
+    end_times: tuple[str | None, ...] = ()
+    prices: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
 
-    def __init__(self, start_time: str, end_time: str, price: float):
-        self.start_time: str = start_time
-        self.end_time: str = end_time
-        self.price: float = price
+def _parse_utc(value: str) -> datetime | None:
+    """Parse an ISO 8601 timestamp and normalise it to UTC."""
+    try:
+        # Nordpool sends plain ISO 8601, which the C parser handles directly
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        parsed = dt_util.parse_datetime(value)
+        if parsed is None:
+            return None
 
-    def __repr__(self):
-        return f"Price is {self.price} from {self.start_time} to {self.end_time}"
+    if parsed.tzinfo is UTC:
+        return parsed
+    return dt_util.as_utc(parsed)
+
+
+def find_nordpool_entry_id(hass: HomeAssistant) -> str:
+    """Return the id of the first Nordpool config entry."""
+    entries = hass.config_entries.async_entries("nordpool")
+    if not entries:
+        raise RuntimeError(
+            "No Nordpool config entry found, ensure the official Nordpool integration is set up (not HACS)"
+        )
+    return entries[0].entry_id
 
 
 async def fetch_next_24h_prices_15m(
@@ -26,20 +62,16 @@ async def fetch_next_24h_prices_15m(
     *,
     area: str,
     currency: str | None = None,
-) -> list[dict]:
+    config_entry_id: str | None = None,
+) -> ElectricityPriceSeries:
     _LOGGER.debug(
         "Fetching electricity prices for area=%s, currency=%s",
         area,
         currency,
     )
 
-    # Get the first Nordpool entry id
-    entries = hass.config_entries.async_entries("nordpool")
-    if not entries:
-        raise RuntimeError(
-            "No Nordpool config entry found, ensure the official Nordpool integration is set up (not HACS)"
-        )
-    config_entry_id = entries[0].entry_id
+    if config_entry_id is None:
+        config_entry_id = find_nordpool_entry_id(hass)
 
     now = dt_util.utcnow()
     end = now + timedelta(hours=24)
@@ -66,28 +98,35 @@ async def fetch_next_24h_prices_15m(
             return_response=True,
         )
 
-    today_resp = await _fetch(dt_util.now().date())
-    tomorrow_resp = await _fetch((dt_util.now() + timedelta(days=1)).date())
+    # The Nordpool service only takes a single date, so ask for both days at once
+    today = dt_util.now().date()
+    today_resp, tomorrow_resp = await asyncio.gather(
+        _fetch(today), _fetch(today + timedelta(days=1))
+    )
 
     # Response shape is a mapping keyed by area, e.g. {"FI": [{start, end, price}, ...]}
     points = (today_resp.get(area) or []) + (tomorrow_resp.get(area) or [])
 
-    # Keep only points that start within [now, now+24h)
-    out = []
+    # Nordpool returns each day in order and tomorrow follows today, so the
+    # points come out sorted without a final sort. Keep the ones that start
+    # within [now, now+24h), skipping any whose start can't be parsed.
+    start_times: list[str] = []
+    end_times: list[str | None] = []
+    prices: list[float] = []
     for p in points:
-        start = dt_util.parse_datetime(p["start"])
-        if start is None:
+        start = _parse_utc(p["start"])
+        if start is None or start < now:
             continue
-        start_utc = dt_util.as_utc(start)
-        if now <= start_utc < end:
-            out.append(
-                ElectricityPriceData(
-                    start_utc.isoformat(),
-                    p.get("end"),
-                    float(p["price"]),
-                )
-            )
-
-    out.sort(key=lambda x: x.start_time)
+        if start >= end:
+            # Everything after this is further out still
+            break
+        start_times.append(start.isoformat())
+        point_end = _parse_utc(p["end"]) if p.get("end") else None
+        end_times.append(point_end.isoformat() if point_end is not None else None)
+        prices.append(float(p["price"]))
+
+    out = ElectricityPriceSeries(
+        tuple(start_times), tuple(end_times), np.asarray(prices, dtype=float)
+    )
     _LOGGER.debug("Fetched electricity prices: %s", out)
     return out
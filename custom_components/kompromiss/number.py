@@ -10,6 +10,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .data import KompromissConfigEntry
 from .device import ensure_device
 
 from .const import (
@@ -63,7 +64,7 @@ NUMBER_ENTITIES = [
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: KompromissConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ):
     """Set up Kompromiss number entities."""
@@ -84,7 +85,7 @@ class KompromissNumber(NumberEntity):
     def __init__(
         self,
         hass: HomeAssistant,
-        config_entry: ConfigEntry,
+        config_entry: KompromissConfigEntry,
         device_id: str,
         config: NumberConfig,
     ):
@@ -96,6 +97,7 @@ class KompromissNumber(NumberEntity):
 
         # Set class attributes from config
         self._attr_unique_id = config.unique_id
+        self._attr_device_info = {"identifiers": {(DOMAIN, config_entry.entry_id)}}
         self._attr_native_min_value = config.min_value
         self._attr_native_max_value = config.max_value
         self._attr_native_step = config.step
@@ -103,11 +105,6 @@ class KompromissNumber(NumberEntity):
         if config.unit_of_measurement:
             self._attr_native_unit_of_measurement = config.unit_of_measurement
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {"identifiers": {(DOMAIN, self._config_entry.entry_id)}}
-
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
@@ -135,9 +132,14 @@ class KompromissNumber(NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the value in config entry options."""
+        options = self._config_entry.options
+        storage_key = self._config.storage_key
+        if storage_key in options and options[storage_key] == value:
+            # Nothing changed, so don't rewrite the entry or re-run the controller
+            return
+
         # Update the config entry options
-        new_options = dict(self._config_entry.options)
-        new_options[self._config.storage_key] = value
+        new_options = {**options, storage_key: value}
 
         self.hass.config_entries.async_update_entry(
             self._config_entry, options=new_options
@@ -146,9 +148,8 @@ class KompromissNumber(NumberEntity):
         self.async_write_ha_state()
 
         # Immediately update controller parameters
-        controller = self.hass.data.get(DOMAIN, {}).get(self._config_entry.entry_id)
-        if controller:
-            await controller.update_parameters_from_options(new_options)
+        controller = self._config_entry.runtime_data.controller
+        await controller.update_parameters_from_options(new_options)
 
         # Send signal if configured (for backward compatibility)
         if self._config.signal_on_change:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Final
 
 
 class Regulator(ABC):
@@ -12,8 +13,8 @@ class Regulator(ABC):
     control logic. Subclasses must implement the regulate method.
     """
 
-    MINIMUM_SIMULATED_TEMPERATURE: float = -40.0
-    MAXIMUM_SIMULATED_TEMPERATURE: float = 19.0
+    MINIMUM_SIMULATED_TEMPERATURE: Final[float] = -40.0
+    MAXIMUM_SIMULATED_TEMPERATURE: Final[float] = 19.0
 
     @abstractmethod
     async def async_regulate(self) -> float:
@@ -10,8 +10,11 @@ curve that maps outdoor temperature to the desired return temperature.
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import pairwise
 import time
-from typing import Final
+from typing import Any, ClassVar, Final
 from datetime import datetime, timezone
 
 import numpy as np
@@ -51,6 +54,15 @@ from ..state import ControllerState
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+# MPC parameters that don't end up in the NLP, the horizon is passed separately
+_NON_NLP_PARAMETERS: Final[frozenset[str]] = frozenset(
+    (
+        "prediction_horizon",
+        "electricity_price_area",
+        "electricity_price_currency",
+    )
+)
+
 
 class MPCParameters:
     """Holds parameters for the MPC regulator."""
@@ -96,8 +108,8 @@ class MPCParameters:
     electricity_price_area: str = DEFAULT_ELECTRICITY_PRICE_AREA
     electricity_price_currency: str = DEFAULT_ELECTRICITY_PRICE_CURRENCY
 
-    def __repr__(self) -> str:
-        """Return string representation of MPCParameters."""
+    def as_dict(self) -> dict[str, Any]:
+        """Return every parameter, class defaults overridden by instance values."""
         # Get all class attributes with defaults
         all_attrs = {
             k: v
@@ -106,11 +118,25 @@ class MPCParameters:
         }
         # Override with any instance attributes
         all_attrs.update(self.__dict__)
+        return all_attrs
 
-        attrs = "\n".join(f"{key}={value!r}" for key, value in all_attrs.items())
+    def __repr__(self) -> str:
+        """Return string representation of MPCParameters."""
+        attrs = "\n".join(f"{key}={value!r}" for key, value in self.as_dict().items())
         return f"MPCParameters({attrs})"
 
 
+@dataclass(slots=True, frozen=True)
+class _MPCProblem:
+    """A built MPC NLP together with its bounds."""
+
+    solver: ca.Function
+    lbx: ca.DM
+    ubx: ca.DM
+    lbg: ca.DM
+    ubg: ca.DM
+
+
 class MPCRegulator(Regulator):
     """Full MPC regulator using a 1R1C + medium thermal model.
 
@@ -123,9 +149,24 @@ class MPCRegulator(Regulator):
     temperature setpoint via a linear heat curve of outdoor temperature.
     """
 
+    # Solutions are reused for inputs that agree to this many decimals
+    SOLUTION_CACHE_DECIMALS: int = 1
+    SOLUTION_CACHE_SIZE: int = 64
+    PROBLEM_CACHE_SIZE: int = 8
+
+    # Built NLPs shared by all regulators, keyed by horizon and parameters
+    _shared_problems: ClassVar[OrderedDict[tuple, _MPCProblem]] = OrderedDict()
+
     def __init__(self) -> None:
         self._state: ControllerState = ControllerState()
         self._parameters: MPCParameters = MPCParameters()
+        self._solution_cache: OrderedDict[
+            tuple, tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        ] = OrderedDict()
+        # Built NLPs by horizon, the horizon shrinks when prices run short
+        self._problems: dict[int, _MPCProblem] = {}
+        # Horizon, monotonic time and decision vector of the last solve
+        self._last_solution: tuple[int, float, np.ndarray] | None = None
         super().__init__()
 
     def set_state(self, state: ControllerState) -> None:
@@ -136,6 +177,12 @@ class MPCRegulator(Regulator):
         """Return the current controller state."""
         return self._state
 
+    async def async_step(self, state: ControllerState) -> ControllerState:
+        """Regulate from the given state and return the updated state."""
+        self._state = state
+        await self.async_regulate()
+        return self._state
+
     def update_parameters_from_options(self, options: dict) -> None:
         """Update all MPC parameters from config entry options."""
 
@@ -147,6 +194,11 @@ class MPCRegulator(Regulator):
 
             setattr(self._parameters, key, value)
 
+        # Cached solutions and NLPs were built with the old parameters
+        self._solution_cache.clear()
+        self._problems.clear()
+        self._last_solution = None
+
     def _heat_from_return_setpoint(
         self, return_temp: ca.SX, medium_temp: ca.SX
     ) -> ca.SX:
@@ -157,17 +209,14 @@ class MPCRegulator(Regulator):
         capped = ca.fmin(self._parameters.heater_thermal_power, raw_heat)
         return ca.fmax(0.0, capped)
 
-    def _solve(
-        self,
-        initial_room_temp: float,
-        initial_medium_temp: float,
-        prev_simulated_outdoor: float,
-        horizon: int,
-    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-        """Solve MPC using CasADi IPOPT with room + medium dynamics."""
+    def _build_problem(self, horizon: int) -> _MPCProblem:
+        """Build the MPC NLP for a horizon.
 
-        if self._parameters.heat_curve_slope == 0:
-            raise RuntimeError("Heat curve slope cannot be zero")
+        Everything that changes between solves (initial temperatures, the
+        previous simulated outdoor temperature, the actual outdoor temperature
+        and the per-step prices) is an NLP parameter, so the solver can be
+        reused until the MPC parameters change.
+        """
 
         def _simulated_outdoor(u: ca.SX) -> ca.SX:
             return (
@@ -181,178 +230,130 @@ class MPCRegulator(Regulator):
         slack_lower = ca.SX.sym("sL", horizon)
         slack_upper = ca.SX.sym("sH", horizon)
 
-        # Objective function
-        objective = 0
-        for step in range(horizon):
-            # We only penalize temperature error when below the target, not above
-            temperature_error = ca.fmin(
-                0, room_temps[step] - self._parameters.target_temperature
-            )
-
-            # Heat flow is computed from the return setpoint via the heat curve
-            heat_flow = self._heat_from_return_setpoint(
-                return_temp_setpoints[step], medium_temps[step]
-            )
-
-            # Only factor in energy cost if price control is enabled
-            energy_cost: float | None = None
-            if self._parameters.electricity_price_enabled:
-                # Map simulated step to nearest electricity price point
-                price_index = int(
-                    round(
-                        (step * self._parameters.time_step)
-                        / ELECTRICITY_PRICE_TIME_STEP
-                    )
-                )
-                price_index = min(
-                    len(self._state.electricity_price) - 1, max(0, price_index)
-                )
-
-                price = self._state.electricity_price[price_index].price
-                energy_cost = (
-                    heat_flow / 1000 * price * (self._parameters.time_step / 3600)
-                )
-
-            simulated_outdoor_temperature_delta: float
+        # Parameters
+        initial_room_temp = ca.SX.sym("room_0")
+        initial_medium_temp = ca.SX.sym("medium_0")
+        prev_simulated_outdoor = ca.SX.sym("prev_simulated_outdoor")
+        actual_outdoor_temp = ca.SX.sym("actual_outdoor")
+        prices = ca.SX.sym(
+            "price", horizon if self._parameters.electricity_price_enabled else 0
+        )
 
-            if step == 0:
-                simulated_outdoor_temperature_delta = (
-                    _simulated_outdoor(return_temp_setpoints[step])
-                    - prev_simulated_outdoor
-                )
-            else:
-                simulated_outdoor_temperature_delta = _simulated_outdoor(
-                    return_temp_setpoints[step]
-                ) - _simulated_outdoor(return_temp_setpoints[step - 1])
+        # State at the start of each step
+        room_now = room_temps[:horizon]
+        medium_now = medium_temps[:horizon]
 
-            temperature_deviation_objective = (
-                self._parameters.temperature_deviation_penalty * (temperature_error**2)
-            )
+        # Heat flow is computed from the return setpoint via the heat curve
+        heat_flow = self._heat_from_return_setpoint(return_temp_setpoints, medium_now)
 
-            comfort_band_objective = self._parameters.comfort_band_violation_penalty * (
-                slack_lower[step] ** 2 + slack_upper[step] ** 2
-            )
-
-            energy_cost_objective = 0
-            if self._parameters.electricity_price_enabled:
-                if energy_cost is None:
-                    raise RuntimeError(
-                        "Energy cost is None despite price control being enabled"
-                    )
+        # Simulated outdoor temperature moves, the first against the last output
+        simulated_outdoor = _simulated_outdoor(return_temp_setpoints)
+        simulated_outdoor_temperature_delta = simulated_outdoor - ca.vertcat(
+            prev_simulated_outdoor, simulated_outdoor[: horizon - 1]
+        )
 
-                energy_cost_objective = (
-                    self._parameters.energy_cost_penalty * energy_cost
-                )
+        # Objective function
+        # We only penalize temperature error when below the target, not above
+        temperature_error = ca.fmin(0, room_now - self._parameters.target_temperature)
+        objective = (
+            self._parameters.temperature_deviation_penalty
+            * ca.sumsqr(temperature_error)
+            + self._parameters.comfort_band_violation_penalty
+            * (ca.sumsqr(slack_lower) + ca.sumsqr(slack_upper))
+            + self._parameters.simulated_outdoor_move_penalty
+            * ca.sumsqr(simulated_outdoor_temperature_delta)
+        )
 
-            outdoor_move_penalty = self._parameters.simulated_outdoor_move_penalty * (
-                simulated_outdoor_temperature_delta**2
+        # Only factor in energy cost if price control is enabled
+        if self._parameters.electricity_price_enabled:
+            energy_cost = (
+                ca.dot(heat_flow, prices) / 1000 * (self._parameters.time_step / 3600)
             )
-
-            # Add all the objectives together
-            objective = (
-                objective
-                + temperature_deviation_objective
-                + comfort_band_objective
-                + energy_cost_objective
-                + outdoor_move_penalty
+            objective += self._parameters.energy_cost_penalty * energy_cost
+
+        # Dynamics
+        next_room = room_now + self._parameters.time_step * (
+            (actual_outdoor_temp - room_now)
+            / (
+                self._parameters.thermal_resistance
+                * self._parameters.thermal_capacitance
             )
-
-        constraints: list[ca.SX] = []
-        constraints_lower: list[float] = []
-        constraints_upper: list[float] = []
-
-        # Initial conditions
-        constraints.append(room_temps[0] - initial_room_temp)
-        constraints_lower.append(0.0)
-        constraints_upper.append(0.0)
-
-        constraints.append(medium_temps[0] - initial_medium_temp)
-        constraints_lower.append(0.0)
-        constraints_upper.append(0.0)
-
-        # Dynamics and slack constraints
-        for step in range(horizon):
-            heat_flow = self._heat_from_return_setpoint(
-                return_temp_setpoints[step], medium_temps[step]
-            )
-
-            next_room = room_temps[step] + self._parameters.time_step * (
-                (self._state.actual_outdoor_temperature - room_temps[step])
-                / (
-                    self._parameters.thermal_resistance
-                    * self._parameters.thermal_capacitance
-                )
-                + (medium_temps[step] - room_temps[step])
-                / (
-                    self._parameters.medium_to_building_thermal_resistance
-                    * self._parameters.thermal_capacitance
-                )
+            + (medium_now - room_now)
+            / (
+                self._parameters.medium_to_building_thermal_resistance
+                * self._parameters.thermal_capacitance
             )
+        )
 
-            next_medium = medium_temps[step] + self._parameters.time_step * (
-                heat_flow / self._parameters.medium_thermal_capacity
-                - (medium_temps[step] - room_temps[step])
-                / (
-                    self._parameters.medium_to_building_thermal_resistance
-                    * self._parameters.medium_thermal_capacity
-                )
-                - (medium_temps[step] - self._state.actual_outdoor_temperature)
-                / (
-                    self._parameters.medium_to_outdoor_thermal_resistance
-                    * self._parameters.medium_thermal_capacity
-                )
+        next_medium = medium_now + self._parameters.time_step * (
+            heat_flow / self._parameters.medium_thermal_capacity
+            - (medium_now - room_now)
+            / (
+                self._parameters.medium_to_building_thermal_resistance
+                * self._parameters.medium_thermal_capacity
             )
-
-            constraints.append(room_temps[step + 1] - next_room)
-            constraints_lower.append(0.0)
-            constraints_upper.append(0.0)
-
-            constraints.append(medium_temps[step + 1] - next_medium)
-            constraints_lower.append(0.0)
-            constraints_upper.append(0.0)
-
-            constraints.append(
-                room_temps[step]
-                + slack_lower[step]
-                - self._parameters.lower_temperature_bound
+            - (medium_now - actual_outdoor_temp)
+            / (
+                self._parameters.medium_to_outdoor_thermal_resistance
+                * self._parameters.medium_thermal_capacity
             )
-            constraints_lower.append(0.0)
-            constraints_upper.append(ca.inf)
+        )
 
-            if step == 0:
-                simulated_outdoor_temperature_delta = (
-                    _simulated_outdoor(return_temp_setpoints[step])
-                    - prev_simulated_outdoor
-                )
-            else:
-                simulated_outdoor_temperature_delta = _simulated_outdoor(
-                    return_temp_setpoints[step]
-                ) - _simulated_outdoor(return_temp_setpoints[step - 1])
+        # Per-step constraints, interleaved step by step to keep the
+        # constraint Jacobian banded: room dynamics, medium dynamics,
+        # lower comfort bound with slack and the outdoor ramp limit
+        step_constraints = ca.horzcat(
+            room_temps[1:] - next_room,
+            medium_temps[1:] - next_medium,
+            room_now + slack_lower - self._parameters.lower_temperature_bound,
+            simulated_outdoor_temperature_delta,
+        )
+        constraints = ca.vertcat(
+            # Initial conditions
+            room_temps[0] - initial_room_temp,
+            medium_temps[0] - initial_medium_temp,
+            ca.reshape(step_constraints.T, -1, 1),
+        )
 
-            constraints.append(simulated_outdoor_temperature_delta)
-            constraints_lower.append(-self._parameters.outdoor_ramp_limit)
-            constraints_upper.append(self._parameters.outdoor_ramp_limit)
+        ramp_limit = self._parameters.outdoor_ramp_limit
+        constraints_lower = np.concatenate(
+            ([0.0, 0.0], np.tile([0.0, 0.0, 0.0, -ramp_limit], horizon))
+        )
+        constraints_upper = np.concatenate(
+            ([0.0, 0.0], np.tile([0.0, 0.0, np.inf, ramp_limit], horizon))
+        )
 
         decision_vars = ca.vertcat(
             return_temp_setpoints, room_temps, medium_temps, slack_lower, slack_upper
         )
 
-        decision_lower_bounds = (
-            [self._parameters.minimum_medium_return_temperature] * horizon
-            + [-ca.inf] * (horizon + 1)
-            + [-ca.inf] * (horizon + 1)
-            + [0.0] * horizon
-            + [0.0] * horizon
+        decision_lower_bounds = np.concatenate(
+            (
+                np.full(horizon, self._parameters.minimum_medium_return_temperature),
+                np.full(2 * (horizon + 1), -np.inf),
+                np.zeros(2 * horizon),
+            )
         )
-        decision_upper_bounds = (
-            [self._parameters.maximum_medium_return_temperature] * horizon
-            + [ca.inf] * (horizon + 1)
-            + [ca.inf] * (horizon + 1)
-            + [ca.inf] * horizon
-            + [ca.inf] * horizon
+        decision_upper_bounds = np.concatenate(
+            (
+                np.full(horizon, self._parameters.maximum_medium_return_temperature),
+                np.full(2 * (horizon + 1) + 2 * horizon, np.inf),
+            )
         )
 
-        nlp = {"x": decision_vars, "f": objective, "g": ca.vertcat(*constraints)}
+        parameters = ca.vertcat(
+            initial_room_temp,
+            initial_medium_temp,
+            prev_simulated_outdoor,
+            actual_outdoor_temp,
+            prices,
+        )
+        nlp = {
+            "x": decision_vars,
+            "f": objective,
+            "g": constraints,
+            "p": parameters,
+        }
         solver_opts = {
             "print_time": False,
             "ipopt": {
@@ -363,30 +364,145 @@ class MPCRegulator(Regulator):
                 "tol": 1e-6,
             },
         }
-        solver = ca.nlpsol("solver", "ipopt", nlp, solver_opts)
-
-        # Initial guess: keep temperatures near initial, setpoints near intercept
-        room_guess = [initial_room_temp]
-        medium_guess = [initial_medium_temp]
-        for _ in range(horizon):
-            room_guess.append(room_guess[-1])
-            medium_guess.append(medium_guess[-1])
-
-        return_guess = [self._parameters.heat_curve_intercept] * horizon
-        slack_guess = [0.0] * horizon
-        initial_guess = (
-            return_guess + room_guess + medium_guess + slack_guess + slack_guess
-        )
 
-        solution = solver(
-            x0=ca.DM(initial_guess),
-            lbg=ca.DM(constraints_lower),
-            ubg=ca.DM(constraints_upper),
+        return _MPCProblem(
+            solver=ca.nlpsol("solver", "ipopt", nlp, solver_opts),
             lbx=ca.DM(decision_lower_bounds),
             ubx=ca.DM(decision_upper_bounds),
+            lbg=ca.DM(constraints_lower),
+            ubg=ca.DM(constraints_upper),
         )
 
-        solution_vector = np.array(solution["x"]).flatten()
+    def _get_shared_problem(self, horizon: int) -> _MPCProblem:
+        """Return the NLP for a horizon, reusing one another regulator built.
+
+        The MPC parameters are baked into the NLP, so regulators only share
+        a problem when every parameter that shapes it agrees.
+        """
+        key = (
+            horizon,
+            tuple(
+                item
+                for item in self._parameters.as_dict().items()
+                if item[0] not in _NON_NLP_PARAMETERS
+            ),
+        )
+        problems = type(self)._shared_problems
+
+        problem = problems.get(key)
+        if problem is None:
+            problem = problems[key] = self._build_problem(horizon)
+            if len(problems) > self.PROBLEM_CACHE_SIZE:
+                problems.popitem(last=False)
+        else:
+            problems.move_to_end(key)
+
+        return problem
+
+    def _warm_start(
+        self, horizon: int, initial_room_temp: float, initial_medium_temp: float
+    ) -> np.ndarray | None:
+        """Return the previous solution shifted to now, or None if there is none.
+
+        Regulation runs whenever a sensor changes rather than once per time
+        step, so the previous solution is shifted by however many steps have
+        actually elapsed, which is often none.
+        """
+        if self._last_solution is None:
+            return None
+
+        last_horizon, solved_at, solution_vector = self._last_solution
+        if last_horizon != horizon:
+            return None
+
+        shift = min(
+            horizon,
+            int(round((time.monotonic() - solved_at) / self._parameters.time_step)),
+        )
+
+        # Decision vector layout is [u(N), room(N+1), medium(N+1), sL(N), sH(N)]
+        blocks = np.split(
+            solution_vector,
+            np.cumsum([horizon, horizon + 1, horizon + 1, horizon]),
+        )
+        if shift:
+            blocks = [
+                np.concatenate((block[shift:], np.repeat(block[-1], shift)))
+                for block in blocks
+            ]
+
+        # The initial states are fixed by the constraints, start them there
+        blocks[1][0] = initial_room_temp
+        blocks[2][0] = initial_medium_temp
+
+        return np.concatenate(blocks)
+
+    def _solve(
+        self,
+        initial_room_temp: float,
+        initial_medium_temp: float,
+        prev_simulated_outdoor: float,
+        horizon: int,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Solve MPC using CasADi IPOPT with room + medium dynamics."""
+
+        if self._parameters.heat_curve_slope == 0:
+            raise RuntimeError("Heat curve slope cannot be zero")
+
+        problem = self._problems.get(horizon)
+        if problem is None:
+            problem = self._problems[horizon] = self._get_shared_problem(horizon)
+
+        initial_conditions = np.array(
+            [
+                initial_room_temp,
+                initial_medium_temp,
+                prev_simulated_outdoor,
+                self._state.actual_outdoor_temperature,
+            ],
+            dtype=float,
+        )
+        if self._parameters.electricity_price_enabled:
+            # Map each simulated step to the nearest electricity price point
+            prices = self._state.electricity_price.prices
+            price_index = np.clip(
+                np.rint(
+                    np.arange(horizon)
+                    * self._parameters.time_step
+                    / ELECTRICITY_PRICE_TIME_STEP
+                ).astype(int),
+                0,
+                len(prices) - 1,
+            )
+            parameters = np.concatenate((initial_conditions, prices[price_index]))
+        else:
+            parameters = initial_conditions
+
+        initial_guess = self._warm_start(
+            horizon, initial_room_temp, initial_medium_temp
+        )
+        if initial_guess is None:
+            # Initial guess: keep temperatures near initial, setpoints near intercept
+            initial_guess = np.concatenate(
+                (
+                    np.full(horizon, self._parameters.heat_curve_intercept),
+                    np.full(horizon + 1, initial_room_temp),
+                    np.full(horizon + 1, initial_medium_temp),
+                    np.zeros(2 * horizon),
+                )
+            )
+
+        solution = problem.solver(
+            x0=ca.DM(initial_guess),
+            p=ca.DM(parameters),
+            lbg=problem.lbg,
+            ubg=problem.ubg,
+            lbx=problem.lbx,
+            ubx=problem.ubx,
+        )
+
+        solution_vector = solution["x"].full().ravel()
+        self._last_solution = (horizon, time.monotonic(), solution_vector)
         idx = 0
         return_setpoints = solution_vector[idx : idx + horizon]
         idx += horizon
@@ -398,24 +514,18 @@ class MPCRegulator(Regulator):
         idx += horizon + 1
 
         # Compute heat inputs for logging and energy calculations
-        heat_inputs = []
-        for step in range(horizon):
-            heat_inputs.append(
-                min(
-                    self._parameters.heater_thermal_power,
-                    max(
-                        0.0,
-                        self._parameters.heater_transfer_coefficient
-                        * (return_setpoints[step] - medium_temperatures[step]),
-                    ),
-                )
-            )
+        heat_inputs = np.clip(
+            self._parameters.heater_transfer_coefficient
+            * (return_setpoints - medium_temperatures[:horizon]),
+            0.0,
+            self._parameters.heater_thermal_power,
+        )
 
         return (
             return_setpoints.astype(float),
             indoor_temperatures.astype(float),
             medium_temperatures.astype(float),
-            np.array(heat_inputs, dtype=float),
+            heat_inputs.astype(float),
         )
 
     async def async_regulate(self) -> float:
@@ -454,7 +564,7 @@ class MPCRegulator(Regulator):
                 len(self._state.electricity_price) * ELECTRICITY_PRICE_TIME_STEP
                 >= 3600 * ELECTRICITY_PRICE_MINIMUM_HOURS_AVAILABLE
             ):
-                horizon = np.floor(
+                horizon = int(
                     len(self._state.electricity_price)
                     * ELECTRICITY_PRICE_TIME_STEP
                     / self._parameters.time_step
@@ -495,67 +605,85 @@ class MPCRegulator(Regulator):
             raise RuntimeError("No reference outdoor temperature for ramp constraint")
 
         start_time = time.perf_counter()
+
+        decimals = self.SOLUTION_CACHE_DECIMALS
+        cache_key = (
+            round(initial_room_temperature, decimals),
+            round(self._state.actual_outdoor_temperature, decimals),
+            round(previous_simulated_outdoor_temperature, decimals),
+            horizon,
+            self._state.electricity_price.prices.tobytes()
+            if self._parameters.electricity_price_enabled
+            else None,
+        )
+        solution = self._solution_cache.get(cache_key)
+        if solution is None:
+            solution = self._solve(
+                initial_room_temperature,
+                initial_medium_temperature,
+                previous_simulated_outdoor_temperature,
+                horizon,
+            )
+            # Only converged solutions are worth replaying for later steps
+            if self._problems[horizon].solver.stats()["success"]:
+                self._solution_cache[cache_key] = solution
+                if len(self._solution_cache) > self.SOLUTION_CACHE_SIZE:
+                    self._solution_cache.popitem(last=False)
+            else:
+                _LOGGER.debug("MPC solve did not converge, not caching the solution")
+        else:
+            _LOGGER.debug("Reusing cached MPC solution")
+            self._solution_cache.move_to_end(cache_key)
+
         (
             return_setpoints,
             indoor_temperatures,
             medium_temperatures,
             thermal_power,
-        ) = self._solve(
-            initial_room_temperature,
-            initial_medium_temperature,
-            previous_simulated_outdoor_temperature,
-            horizon,
-        )
+        ) = solution
 
         now = time.time()
+        state = self._state
+        time_step = self._parameters.time_step
+
+        # Map the return setpoints back through the heat curve in one pass
+        simulated_outdoor_temperatures = np.clip(
+            (return_setpoints - self._parameters.heat_curve_intercept)
+            / self._parameters.heat_curve_slope,
+            self.MINIMUM_SIMULATED_TEMPERATURE,
+            self.MAXIMUM_SIMULATED_TEMPERATURE,
+        )
+        outdoor_temperature_offsets = (
+            simulated_outdoor_temperatures - state.actual_outdoor_temperature
+        )
 
-        self._state.projected_indoor_temperature = []
-        self._state.projected_thermal_power = []
-        self._state.projected_medium_temperature = []
-        self._state.simulated_outdoor_temperatures = []
-        self._state.outdoor_temperature_offsets = []
-
-        for i in range(horizon):
-            timestamp = now + i * self._parameters.time_step
-            next_timestamp = now + (i + 1) * self._parameters.time_step
-
-            data_dictionary = {
-                "start_time": datetime.fromtimestamp(
-                    timestamp, tz=timezone.utc
-                ).isoformat(),
-                "end_time": datetime.fromtimestamp(
-                    next_timestamp, tz=timezone.utc
-                ).isoformat(),
-            }
-
-            simulated_outdoor_temperature = (
-                return_setpoints[i] - self._parameters.heat_curve_intercept
-            ) / self._parameters.heat_curve_slope
-
-            simulated_outdoor_temperature = max(
-                self.MINIMUM_SIMULATED_TEMPERATURE,
-                min(simulated_outdoor_temperature, self.MAXIMUM_SIMULATED_TEMPERATURE),
-            )
-
-            outdoor_temperature_offset = (
-                simulated_outdoor_temperature - self._state.actual_outdoor_temperature
-            )
-
-            self._state.projected_indoor_temperature.append(
-                {**data_dictionary, "temperature": float(indoor_temperatures[i])}
-            )
-            self._state.projected_thermal_power.append(
-                {**data_dictionary, "temperature": int(thermal_power[i])}
-            )
-            self._state.projected_medium_temperature.append(
-                {**data_dictionary, "temperature": float(medium_temperatures[i])}
-            )
-            self._state.simulated_outdoor_temperatures.append(
-                {**data_dictionary, "temperature": float(simulated_outdoor_temperature)}
-            )
-            self._state.outdoor_temperature_offsets.append(
-                {**data_dictionary, "temperature": outdoor_temperature_offset}
-            )
+        # Each step ends where the next one starts, so format every boundary once
+        boundaries = [
+            datetime.fromtimestamp(now + i * time_step, tz=timezone.utc).isoformat()
+            for i in range(horizon + 1)
+        ]
+        periods = [
+            {"start_time": start, "end_time": end}
+            for start, end in pairwise(boundaries)
+        ]
+
+        def _projection(values: list) -> list[dict[str, Any]]:
+            return [
+                {**period, "temperature": value}
+                for period, value in zip(periods, values)
+            ]
+
+        state.projected_indoor_temperature = _projection(indoor_temperatures.tolist())
+        state.projected_thermal_power = _projection(
+            [int(power) for power in thermal_power.tolist()]
+        )
+        state.projected_medium_temperature = _projection(medium_temperatures.tolist())
+        state.simulated_outdoor_temperatures = _projection(
+            simulated_outdoor_temperatures.tolist()
+        )
+        state.outdoor_temperature_offsets = _projection(
+            outdoor_temperature_offsets.tolist()
+        )
 
         computation_time = time.perf_counter() - start_time
         self._state.computation_time = computation_time * 1000
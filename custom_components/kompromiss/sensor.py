@@ -11,9 +11,10 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 
 from .controller import ControllerState, TemperatureController
+from .data import KompromissConfigEntry
 from .device import ensure_device
 
 from .const import (
@@ -28,10 +29,10 @@ _LOGGER: Final = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
-    hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities
+    hass: HomeAssistant, config_entry: KompromissConfigEntry, async_add_entities
 ):
     device = ensure_device(hass, config_entry)
-    controller = hass.data[DOMAIN][config_entry.entry_id]
+    controller = config_entry.runtime_data.controller
 
     sensors = [
         SimulatedOutdoorTemperatureSensor(config_entry, device.id, controller),
@@ -52,10 +53,7 @@ class _BaseKompromissSensor(SensorEntity):
     def __init__(self, config_entry: ConfigEntry, device_id: str):
         self._config_entry = config_entry
         self._device_id = device_id
-
-    @property
-    def device_info(self):
-        return {"identifiers": {(DOMAIN, self._config_entry.entry_id)}}
+        self._attr_device_info = {"identifiers": {(DOMAIN, config_entry.entry_id)}}
 
 
 class _ControllerBoundSensor(_BaseKompromissSensor):
@@ -95,6 +93,13 @@ class _PassthroughEntitySensor(_BaseKompromissSensor):
 
     _config_key: str
 
+    def __init__(self, config_entry: ConfigEntry, device_id: str):
+        super().__init__(config_entry, device_id)
+        # HA replaces the State object on every update, so the last one seen
+        # tells us whether the cached float is still current
+        self._last_state: State | None = None
+        self._last_value: float | None = None
+
     @property
     def native_value(self) -> float | None:  # type: ignore[override]
         hass = self.hass
@@ -109,10 +114,17 @@ class _PassthroughEntitySensor(_BaseKompromissSensor):
         if state is None:
             return None
 
+        if state is self._last_state:
+            return self._last_value
+
         try:
-            return float(state.state)
+            value = float(state.state)
         except (ValueError, TypeError):
-            return None
+            value = None
+
+        self._last_state = state
+        self._last_value = value
+        return value
 
 
 class SimulatedOutdoorTemperatureSensor(_ControllerBoundSensor):
@@ -1,24 +1,27 @@
+from dataclasses import dataclass, field
 from typing import Any
 
-from .electricity import ElectricityPriceData
+from .electricity import ElectricityPriceSeries
 
 
+@dataclass(slots=True)
 class ControllerState:
     """Holds the current state of the controller."""
 
-    def __init__(self):
-        self.timestamps: list[str] = []
-        self.simulated_outdoor_temperatures: list[dict[str, Any]] | None = None
-        self.actual_outdoor_temperature: float | None = None
-        self.indoor_temperature: float | None = None
-        self.projected_indoor_temperature: list[dict[str, Any]] | None = None
-        self.projected_thermal_power: list[dict[str, Any]] | None = None
-        self.outdoor_temperature_offsets: list[dict[str, Any]] | None = None
-        self.medium_temperature: float | None = None
-        self.projected_medium_temperature: list[dict[str, Any]] | None = None
-        self.return_temperature_setpoint: float | None = None
-        self.computation_time: float | None = None
-        self.electricity_price: list[ElectricityPriceData] = []
+    timestamps: list[str] = field(default_factory=list)
+    simulated_outdoor_temperatures: list[dict[str, Any]] | None = None
+    actual_outdoor_temperature: float | None = None
+    indoor_temperature: float | None = None
+    projected_indoor_temperature: list[dict[str, Any]] | None = None
+    projected_thermal_power: list[dict[str, Any]] | None = None
+    outdoor_temperature_offsets: list[dict[str, Any]] | None = None
+    medium_temperature: float | None = None
+    projected_medium_temperature: list[dict[str, Any]] | None = None
+    return_temperature_setpoint: float | None = None
+    computation_time: float | None = None
+    electricity_price: ElectricityPriceSeries = field(
+        default_factory=ElectricityPriceSeries
+    )
 
     def is_valid(self) -> bool:
         """Check if the state has valid temperature readings."""